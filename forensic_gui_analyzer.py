@@ -11,12 +11,13 @@ Features:
 - File carving and defragmentation
 """
 
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+import functools
+import heapq
+import itertools
+import mmap
 import threading
 import queue
-import struct
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import sys
@@ -25,9 +26,50 @@ from datetime import datetime
 from collections import defaultdict, namedtuple
 import math
 
+import numpy as np
+
+# Tkinter is imported lazily (see _lazy_tk) so the analyzer classes can be
+# used from headless processes without pulling in Tk
+tk = None
+ttk = None
+filedialog = None
+messagebox = None
+ImageTk = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts(ts, fmt):
+    """Format a datetime, caching results
+
+    Hover and details views re-format the same block timestamps on every
+    event; strftime is slow enough in CPython to be worth memoizing.
+    """
+    return ts.strftime(fmt)
+
+
+def _lazy_tk():
+    """Import tkinter and friends on first GUI use"""
+    global tk, ttk, filedialog, messagebox, ImageTk
+    if tk is not None:
+        return
+
+    import tkinter as tk_mod
+    from tkinter import ttk as ttk_mod
+    from tkinter import filedialog as filedialog_mod
+    from tkinter import messagebox as messagebox_mod
+
+    tk = tk_mod
+    ttk = ttk_mod
+    filedialog = filedialog_mod
+    messagebox = messagebox_mod
+
+    if PIL_SUPPORT:
+        from PIL import ImageTk as imagetk_mod
+        ImageTk = imagetk_mod
+
 # Import metadata extractor
 try:
-    from metadata_extractor import GenericMetadataExtractor, MACBTimestamps
+    from metadata_extractor import GenericMetadataExtractor
     METADATA_EXTRACTOR_AVAILABLE = True
 except ImportError:
     METADATA_EXTRACTOR_AVAILABLE = False
@@ -42,11 +84,213 @@ except ImportError:
     print("[!] pyewf not installed - E01 support disabled")
     print("    Install with: pip install pyewf-python")
 
+# Try to import Numba for JIT-compiled block metrics
+try:
+    from numba import njit
+    NUMBA_SUPPORT = True
+except ImportError:
+    NUMBA_SUPPORT = False
+
+# Try to import Pillow for fast treemap rendering (ImageTk comes with the
+# lazy tkinter import since it links against Tk)
+try:
+    from PIL import Image, ImageDraw
+    PIL_SUPPORT = True
+except ImportError:
+    PIL_SUPPORT = False
+    print("[!] Pillow not installed - treemap uses slower canvas rectangles")
+    print("    Install with: pip install pillow")
+
+# Hex-dump tables: maps non-printable bytes to '.' for the ASCII column,
+# plus the offset label for each of the 32 lines a 512-byte dump can have
+_ASCII_TBL = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
+_OFFSET_LBLS = [f'{i:08x}' for i in range(0, 512, 16)]
+
+
+def _block_metrics(buf):
+    """Fused zero-check, Shannon entropy and printable ratio for one sample
+
+    Single pass over a uint8 array returning (is_zero, entropy, ratio).
+    JIT-compiled when Numba is available; for 512-byte samples the fused
+    loop beats separate NumPy reductions, whose dispatch overhead dominates
+    at this buffer size.
+    """
+    counts = np.zeros(256, np.int32)
+    printable = 0
+    is_zero = True
+    for i in range(buf.size):
+        b = buf[i]
+        counts[b] += 1
+        if 32 <= b <= 126:
+            printable += 1
+        if b != 0:
+            is_zero = False
+
+    entropy = 0.0
+    n = buf.size
+    for c in counts:
+        if c:
+            p = c / n
+            entropy -= p * math.log2(p)
+
+    return is_zero, entropy, printable / n
+
+
+if NUMBA_SUPPORT:
+    _block_metrics = njit(cache=True, nogil=True, fastmath=True)(_block_metrics)
+
+
 # Data structures
-BlockData = namedtuple('BlockData', [
-    'block_id', 'offset', 'size', 'file_path', 'head_data', 
-    'tail_data', 'metadata', 'mtime', 'ctime', 'atime', 'btime'
-])
+class BlockStore:
+    """Struct-of-arrays storage for analyzed blocks
+
+    Head/tail samples and per-block metrics live in preallocated NumPy
+    arrays (one allocation per column instead of one namedtuple plus two
+    bytes objects per block), which also lets correlation and color mapping
+    run as vectorized cross-block operations. The mapping-style interface
+    (len/iteration/indexing by block_id) matches the dict it replaced.
+    """
+
+    SAMPLE_SIZE = 512  # Bytes kept for head/tail samples
+
+    def __init__(self, capacity=0):
+        self.capacity = capacity
+        self.count = 0
+        self.block_ids = np.empty(capacity, dtype=np.int64)
+        self.offsets = np.empty(capacity, dtype=np.int64)
+        self.sizes = np.empty(capacity, dtype=np.int32)
+        self.head_arr = np.zeros((capacity, self.SAMPLE_SIZE), dtype=np.uint8)
+        self.tail_arr = np.zeros((capacity, self.SAMPLE_SIZE), dtype=np.uint8)
+        self.sample_lens = np.empty(capacity, dtype=np.int32)
+        # Bounded metrics are quantized: entropy [0, 8] in 1/32 steps,
+        # printable ratio [0, 1] in 1/255 steps, zero flags bit-packed —
+        # 3 bytes + 1 bit per block instead of two floats and a bool
+        self.entropy_q = np.empty(capacity, dtype=np.uint8)
+        self.printable_q = np.empty(capacity, dtype=np.uint8)
+        self.is_zero_bits = np.zeros((capacity + 7) // 8, dtype=np.uint8)
+        self.has_magic = [None] * capacity
+        self.file_path = [None] * capacity
+        self.mtime = [None] * capacity
+        self.ctime = [None] * capacity
+        self.atime = [None] * capacity
+        self.btime = [None] * capacity
+        self._rows = {}  # block_id -> row
+
+    def add(self, block_id, offset, data, metadata,
+            mtime=None, ctime=None, atime=None, btime=None):
+        """Append one block; head/tail samples are sliced from data"""
+        row = self.count
+        sample = min(len(data), self.SAMPLE_SIZE)
+
+        self.block_ids[row] = block_id
+        self.offsets[row] = offset
+        self.sizes[row] = len(data)
+        self.sample_lens[row] = sample
+        self.head_arr[row, :sample] = np.frombuffer(data[:sample], dtype=np.uint8)
+        self.tail_arr[row, :sample] = np.frombuffer(data[-sample:], dtype=np.uint8)
+        self.entropy_q[row] = min(255, int(metadata['entropy'] * 32))
+        self.printable_q[row] = int(metadata['printable_ratio'] * 255)
+        if metadata['is_zero']:
+            self.is_zero_bits[row >> 3] |= 1 << (row & 7)
+        self.has_magic[row] = metadata['has_magic']
+        self.mtime[row] = mtime
+        self.ctime[row] = ctime
+        self.atime[row] = atime
+        self.btime[row] = btime
+
+        self._rows[block_id] = row
+        self.count += 1
+        return row
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, block_id):
+        return block_id in self._rows
+
+    def __getitem__(self, block_id):
+        return BlockView(self, self._rows[block_id])
+
+    def get(self, block_id, default=None):
+        row = self._rows.get(block_id)
+        return default if row is None else BlockView(self, row)
+
+    def keys(self):
+        return self._rows.keys()
+
+    def values(self):
+        return (BlockView(self, row) for row in range(self.count))
+
+    def items(self):
+        return ((int(self.block_ids[row]), BlockView(self, row))
+                for row in range(self.count))
+
+
+class BlockView:
+    """Read-only per-block facade over a BlockStore row
+
+    Exposes the attribute names of the old BlockData namedtuple so callers
+    (details panel, correlation, timeline) are unaffected by the SoA layout.
+    """
+
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    @property
+    def block_id(self):
+        return int(self.store.block_ids[self.row])
+
+    @property
+    def offset(self):
+        return int(self.store.offsets[self.row])
+
+    @property
+    def size(self):
+        return int(self.store.sizes[self.row])
+
+    @property
+    def file_path(self):
+        return self.store.file_path[self.row]
+
+    @property
+    def head_data(self):
+        sample = self.store.sample_lens[self.row]
+        return self.store.head_arr[self.row, :sample].tobytes()
+
+    @property
+    def tail_data(self):
+        sample = self.store.sample_lens[self.row]
+        return self.store.tail_arr[self.row, :sample].tobytes()
+
+    @property
+    def metadata(self):
+        store, row = self.store, self.row
+        return {
+            'is_zero': bool(store.is_zero_bits[row >> 3] >> (row & 7) & 1),
+            'entropy': store.entropy_q[row] / 32.0,
+            'has_magic': store.has_magic[row],
+            'printable_ratio': store.printable_q[row] / 255.0
+        }
+
+    @property
+    def mtime(self):
+        return self.store.mtime[self.row]
+
+    @property
+    def ctime(self):
+        return self.store.ctime[self.row]
+
+    @property
+    def atime(self):
+        return self.store.atime[self.row]
+
+    @property
+    def btime(self):
+        return self.store.btime[self.row]
+
 
 FileFragment = namedtuple('FileFragment', [
     'file_id', 'block_ids', 'head_hash', 'tail_hash', 
@@ -54,22 +298,33 @@ FileFragment = namedtuple('FileFragment', [
 ])
 
 CorrelationResult = namedtuple('CorrelationResult', [
-    'block1_id', 'block2_id', 'correlation_score', 
+    'block1_id', 'block2_id', 'correlation_score',
     'sequence_order', 'reconstruction_confidence'
 ])
 
+# Spatial index for treemap hit-testing. Blocks are laid out on a uniform
+# grid, so point queries reduce to two divisions — the degenerate optimal
+# case of a quadtree, with no per-frame index rebuild
+TreemapLayout = namedtuple('TreemapLayout', [
+    'x', 'y', 'cols', 'rows', 'block_width', 'block_height', 'block_ids'
+])
+
 
 class E01Reader:
     """E01 Evidence file reader"""
-    
+
+    PREFETCH_SIZE = 1024 * 1024  # Chunk cached for small sequential reads
+
     def __init__(self, filepath):
         self.filepath = filepath
         self.handle = None
         self.size = 0
-        
+        self._cache = b''
+        self._cache_offset = 0
+
         if not E01_SUPPORT:
             raise ImportError("pyewf not installed")
-    
+
     def open(self):
         """Open E01 file"""
         self.handle = pyewf.handle()
@@ -77,11 +332,26 @@ class E01Reader:
         self.handle.open(filenames)
         self.size = self.handle.get_media_size()
         return True
-    
+
     def read(self, offset, size):
-        """Read data from E01"""
-        self.handle.seek(offset)
-        return self.handle.read(size)
+        """Read data from E01
+
+        Small reads are served from a 1 MB prefetch cache so block-sized
+        sequential scans don't pay pyewf's per-call decompression
+        bookkeeping 4 KB at a time.
+        """
+        if size >= self.PREFETCH_SIZE:
+            self.handle.seek(offset)
+            return self.handle.read(size)
+
+        cache_end = self._cache_offset + len(self._cache)
+        if not (self._cache_offset <= offset and offset + size <= cache_end):
+            self.handle.seek(offset)
+            self._cache = self.handle.read(max(size, self.PREFETCH_SIZE))
+            self._cache_offset = offset
+
+        start = offset - self._cache_offset
+        return self._cache[start:start + size]
     
     def close(self):
         """Close E01 file"""
@@ -96,7 +366,8 @@ class RawDiskReader:
         self.device_path = device_path
         self.handle = None
         self.size = 0
-    
+        self._mmap = None
+
     def open(self):
         """Open raw device"""
         try:
@@ -104,17 +375,79 @@ class RawDiskReader:
             self.handle.seek(0, 2)  # Seek to end
             self.size = self.handle.tell()
             self.handle.seek(0)  # Seek back to start
-            return True
         except PermissionError:
             raise PermissionError(f"Need root permissions to read {self.device_path}")
-    
+
+        # Map the image read-only when the OS allows it: reads become
+        # page-cache-backed copies with no seek+read syscall pair, and
+        # the sequential scans get kernel readahead via madvise
+        try:
+            self._mmap = mmap.mmap(self.handle.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+            if hasattr(mmap.mmap, 'madvise'):
+                self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        except (ValueError, OSError):
+            # Empty file, or a device that cannot be mapped - the
+            # seek/read path below still works
+            self._mmap = None
+
+        return True
+
     def read(self, offset, size):
         """Read data from device"""
+        if self._mmap is not None:
+            return self._mmap[offset:offset + size]
+
         self.handle.seek(offset)
         return self.handle.read(size)
-    
+
+    def readinto(self, offset, buf):
+        """Read into a caller-owned buffer, avoiding a bytes allocation"""
+        if self._mmap is not None:
+            data = self._mmap[offset:offset + len(buf)]
+            n = len(data)
+            buf[:n] = data
+            return n
+
+        self.handle.seek(offset)
+        return self.handle.readinto(buf)
+
+    def pread(self, offset, size):
+        """Positional read with no shared seek state - safe to call
+        from several threads at once"""
+        if self._mmap is not None:
+            return self._mmap[offset:offset + size]
+        return os.pread(self.handle.fileno(), size, offset)
+
+    def advise(self, offset, length):
+        """Hint the OS that a region is about to be scanned sequentially
+
+        Cheap and best-effort: without the hint the kernel may treat
+        the image as random access and skip readahead entirely.
+        """
+        try:
+            if self._mmap is not None:
+                if hasattr(mmap.mmap, 'madvise'):
+                    # madvise wants a page-aligned start
+                    start = offset - (offset % mmap.PAGESIZE)
+                    length = min(length + (offset - start),
+                                 self.size - start)
+                    if length > 0:
+                        self._mmap.madvise(mmap.MADV_WILLNEED, start, length)
+            elif hasattr(os, 'posix_fadvise'):
+                fd = self.handle.fileno()
+                os.posix_fadvise(fd, offset, length,
+                                 os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, offset, length,
+                                 os.POSIX_FADV_WILLNEED)
+        except (OSError, ValueError):
+            pass  # Hints are advisory; never fail a scan over one
+
     def close(self):
         """Close device"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
         if self.handle:
             self.handle.close()
 
@@ -124,7 +457,8 @@ class DiskAnalyzer:
     
     def __init__(self, block_size=4096):
         self.block_size = block_size
-        self.blocks = {}
+        self.sample_budget = 1000  # Blocks analyzed per scan, spread across the disk
+        self.blocks = BlockStore()
         self.files = {}
         self.correlations = []
         self.timeline = []
@@ -162,182 +496,267 @@ class DiskAnalyzer:
         
         return True
     
+    def _sampled_block_runs(self, batch_blocks):
+        """Yield runs of contiguous sampled block ids, capped at batch size
+
+        Blocks are sampled evenly across the whole image (np.linspace) so
+        the analysis budget is representative of the entire disk instead of
+        just its first few megabytes. Contiguous ids are grouped so each
+        run still becomes one large read.
+        """
+        sample_n = min(self.total_blocks, self.sample_budget)
+        if sample_n <= 0:
+            return
+
+        block_ids = np.unique(np.linspace(
+            0, self.total_blocks - 1, sample_n, dtype=np.int64))
+
+        # Split where ids stop being consecutive, then cap run length
+        breaks = np.where(np.diff(block_ids) != 1)[0] + 1
+        for run in np.split(block_ids, breaks):
+            for start in range(0, len(run), batch_blocks):
+                yield run[start:start + batch_blocks]
+
     def analyze_blocks(self, progress_callback=None):
-        """Analyze all blocks and extract metadata"""
+        """Analyze a stratified sample of blocks and extract metadata"""
         blocks_analyzed = 0
-        sample_size = 512  # Bytes to read for head/tail
-        
-        for block_id in range(self.total_blocks):
-            offset = block_id * self.block_size
-            
-            # Read block data
-            try:
-                block_data = self.reader.read(offset, self.block_size)
-                if not block_data:
-                    break
-                
-                # Extract head and tail
-                head_data = block_data[:sample_size]
-                tail_data = block_data[-sample_size:] if len(block_data) > sample_size else block_data
-                
-                # Extract real filesystem metadata with MACB timestamps
-                real_timestamps = None
-                if self.metadata_extractor:
-                    try:
-                        fs_metadata = self.metadata_extractor.extract_block_metadata(offset, self.block_size)
-                        if fs_metadata and fs_metadata.get('timestamps'):
-                            real_timestamps = fs_metadata['timestamps']
-                    except Exception as e:
-                        # If metadata extraction fails, continue without timestamps
-                        pass
-                
-                # Get timestamps or use None
-                mtime = real_timestamps.mtime if real_timestamps else None
-                ctime = real_timestamps.ctime if real_timestamps else None
-                atime = real_timestamps.atime if real_timestamps else None
-                btime = real_timestamps.btime if real_timestamps else None
-                
-                # Create block entry with REAL timestamps from disk
-                self.blocks[block_id] = BlockData(
-                    block_id=block_id,
-                    offset=offset,
-                    size=len(block_data),
-                    file_path=None,  # Will be populated by filesystem analysis
-                    head_data=head_data,
-                    tail_data=tail_data,
-                    metadata=self._extract_metadata(block_data),
-                    mtime=mtime,  # Real modification time from disk
-                    ctime=ctime,  # Real change/creation time from disk
-                    atime=atime,  # Real access time from disk
-                    btime=btime   # Real birth time from disk
-                )
-                
-                blocks_analyzed += 1
-                
-                # Report progress
-                if progress_callback and blocks_analyzed % 100 == 0:
-                    progress = (blocks_analyzed / self.total_blocks) * 100
-                    progress_callback(progress, f"Analyzed {blocks_analyzed}/{self.total_blocks} blocks")
-                
-                # Limit for POC - don't read entire disk
-                if blocks_analyzed >= 1000:  # Analyze first 1000 blocks for POC
-                    break
-                    
-            except Exception as e:
-                print(f"[!] Error reading block {block_id}: {e}")
-                continue
-        
+        batch_blocks = 64  # Blocks fetched per read call
+        sample_n = min(self.total_blocks, self.sample_budget)
+
+        self.blocks = BlockStore(sample_n)
+
+        # One reusable batch buffer: readers that support readinto fill it
+        # in place, and blocks are sliced out as zero-copy memoryviews
+        batch_buf = bytearray(self.block_size * batch_blocks)
+        reader_readinto = getattr(self.reader, 'readinto', None)
+
+        # The NumPy metadata kernels release the GIL, so batches can be
+        # processed by a thread pool while the next read is in flight
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for run_ids in self._sampled_block_runs(batch_blocks):
+                batch_offset = int(run_ids[0]) * self.block_size
+
+                try:
+                    if reader_readinto:
+                        view = memoryview(batch_buf)[:self.block_size
+                                                     * len(run_ids)]
+                        n_read = reader_readinto(batch_offset, view)
+                        batch_data = view[:n_read]
+                    else:
+                        batch_data = memoryview(self.reader.read(
+                            batch_offset, self.block_size * len(run_ids)))
+                except Exception as e:
+                    print(f"[!] Error reading blocks at {run_ids[0]}: {e}")
+                    continue
+
+                if not batch_data:
+                    continue
+
+                # Slice the batch into individual blocks
+                block_buffers = []
+                for i in range(len(run_ids)):
+                    block_data = batch_data[i * self.block_size:
+                                            (i + 1) * self.block_size]
+                    if not block_data:
+                        break
+                    block_buffers.append(block_data)
+
+                # Extract per-block metadata across all cores
+                metadatas = list(pool.map(self._extract_metadata, block_buffers))
+
+                for i, block_data in enumerate(block_buffers):
+                    block_id = int(run_ids[i])
+                    offset = block_id * self.block_size
+
+                    # Extract real filesystem metadata with MACB timestamps
+                    real_timestamps = None
+                    if self.metadata_extractor:
+                        try:
+                            fs_metadata = self.metadata_extractor.extract_block_metadata(offset, self.block_size)
+                            if fs_metadata and fs_metadata.get('timestamps'):
+                                real_timestamps = fs_metadata['timestamps']
+                        except Exception as e:
+                            # If metadata extraction fails, continue without timestamps
+                            pass
+
+                    # Get timestamps or use None; the extractor returns
+                    # a plain dict keyed mtime/ctime/atime/btime
+                    mtime = real_timestamps['mtime'] if real_timestamps else None
+                    ctime = real_timestamps['ctime'] if real_timestamps else None
+                    atime = real_timestamps['atime'] if real_timestamps else None
+                    btime = real_timestamps['btime'] if real_timestamps else None
+
+                    # Create block entry with REAL timestamps from disk
+                    self.blocks.add(
+                        block_id=block_id,
+                        offset=offset,
+                        data=block_data,
+                        metadata=metadatas[i],
+                        mtime=mtime,  # Real modification time from disk
+                        ctime=ctime,  # Real change/creation time from disk
+                        atime=atime,  # Real access time from disk
+                        btime=btime   # Real birth time from disk
+                    )
+
+                    blocks_analyzed += 1
+
+                    # Report progress
+                    if progress_callback and blocks_analyzed % 100 == 0:
+                        progress = (blocks_analyzed / self.total_blocks) * 100
+                        progress_callback(progress, f"Analyzed {blocks_analyzed}/{self.total_blocks} blocks")
+
         if progress_callback:
             progress_callback(100, f"Analysis complete: {blocks_analyzed} blocks")
-        
+
         return blocks_analyzed
     
     def _extract_metadata(self, data):
         """Extract metadata from block data"""
+        sample = data[:512]
+        arr = np.frombuffer(sample, dtype=np.uint8)
+
+        if NUMBA_SUPPORT:
+            is_zero, entropy, printable_ratio = _block_metrics(arr)
+        else:
+            is_zero = not arr.any()
+            entropy = self._calculate_entropy(sample)
+            printable_ratio = self._printable_ratio(sample)
+
         metadata = {
-            'is_zero': all(b == 0 for b in data[:512]),
-            'entropy': self._calculate_entropy(data[:512]),
+            'is_zero': bool(is_zero),
+            'entropy': float(entropy),
             'has_magic': self._detect_file_magic(data),
-            'printable_ratio': self._printable_ratio(data[:512])
+            'printable_ratio': float(printable_ratio)
         }
         return metadata
     
     def _calculate_entropy(self, data):
-        """Calculate Shannon entropy"""
+        """Calculate Shannon entropy (vectorized histogram instead of a Python byte loop)"""
         if not data:
             return 0
-        
-        entropy = 0
-        byte_counts = defaultdict(int)
-        
-        for byte in data:
-            byte_counts[byte] += 1
-        
-        for count in byte_counts.values():
-            probability = count / len(data)
-            entropy -= probability * math.log2(probability)
-        
-        return entropy
+
+        arr = np.frombuffer(data, dtype=np.uint8)
+        counts = np.bincount(arr, minlength=256)
+        nz = counts[counts > 0].astype(np.float64)
+        p = nz / arr.size
+        return float(-(p * np.log2(p)).sum())
     
+    # Magic signatures grouped by first byte: one dict probe replaces a
+    # startswith call per signature, and stays O(1) as the table grows
+    _MAGIC_DISPATCH = {}
+    for _magic, _filetype in {
+        b'\x89PNG': 'PNG',
+        b'\xFF\xD8\xFF': 'JPEG',
+        b'GIF8': 'GIF',
+        b'PK\x03\x04': 'ZIP',
+        b'%PDF': 'PDF',
+        b'MZ': 'EXE',
+        b'\x7fELF': 'ELF',
+        b'RIFF': 'RIFF',
+    }.items():
+        _MAGIC_DISPATCH.setdefault(_magic[0], []).append((_magic, _filetype))
+    del _magic, _filetype
+
     def _detect_file_magic(self, data):
         """Detect file type from magic bytes"""
         if len(data) < 4:
             return None
-        
-        magic_bytes = {
-            b'\x89PNG': 'PNG',
-            b'\xFF\xD8\xFF': 'JPEG',
-            b'GIF8': 'GIF',
-            b'PK\x03\x04': 'ZIP',
-            b'%PDF': 'PDF',
-            b'MZ': 'EXE',
-            b'\x7fELF': 'ELF',
-            b'RIFF': 'RIFF',
-        }
-        
-        for magic, filetype in magic_bytes.items():
-            if data.startswith(magic):
+
+        # bytes() keeps this working for memoryview input from the
+        # zero-copy read path; only the prefix is materialized
+        prefix = bytes(data[:8])
+        for magic, filetype in self._MAGIC_DISPATCH.get(prefix[0], ()):
+            if prefix.startswith(magic):
                 return filetype
-        
+
         return None
     
     def _printable_ratio(self, data):
-        """Calculate ratio of printable characters"""
+        """Calculate ratio of printable characters (boolean-mask reduction)"""
         if not data:
             return 0
-        
-        printable = sum(1 for b in data if 32 <= b <= 126)
-        return printable / len(data)
+
+        arr = np.frombuffer(data, dtype=np.uint8)
+        return float(((arr >= 32) & (arr <= 126)).mean())
     
+    # Bounds on stored correlations: memory stays flat on full-disk scans
+    # and the GUI can only display the top results anyway
+    MAX_CORRELATIONS = 10000
+    MAX_CORRELATIONS_PER_BLOCK = 5
+
     def correlate_blocks(self, progress_callback=None):
         """Correlation engine - find related blocks for defragmentation"""
         print("[*] Running correlation engine...")
-        
+
         block_ids = sorted(self.blocks.keys())
-        correlations_found = 0
-        
+        block_heaps = defaultdict(list)  # block1_id -> top-K (score, b1, b2)
+
+        # Inverted index: 8-byte head prefix -> block ids. A tail can only
+        # continue into a head that starts with the same bytes, so the dict
+        # join prunes the candidate pairs to O(N + K) instead of scoring
+        # every block against its next 50 neighbours
+        head_index = defaultdict(list)
+        for block_id in block_ids:
+            head_index[bytes(self.blocks[block_id].head_data[:8])].append(block_id)
+
         for i, block1_id in enumerate(block_ids):
             block1 = self.blocks[block1_id]
-            
-            # Compare with subsequent blocks
-            for block2_id in block_ids[i+1:i+50]:  # Check next 50 blocks
+            # _calculate_correlation compares tail_data[:128] against
+            # head_data[:128], so the prefix of the tail sample is the key
+            tail_key = bytes(block1.tail_data[:8])
+
+            # Only score candidates whose head continues this tail, still
+            # bounded to the next 50 blocks like the original window
+            for block2_id in head_index.get(tail_key, ()):
+                if not block1_id < block2_id < block1_id + 50:
+                    continue
                 block2 = self.blocks[block2_id]
-                
+
                 # Calculate correlation
                 score = self._calculate_correlation(block1, block2)
-                
+
                 if score > 0.7:  # High correlation threshold
-                    correlation = CorrelationResult(
-                        block1_id=block1_id,
-                        block2_id=block2_id,
-                        correlation_score=score,
-                        sequence_order=(block1_id, block2_id),
-                        reconstruction_confidence=score
-                    )
-                    self.correlations.append(correlation)
-                    correlations_found += 1
-            
+                    heap = block_heaps[block1_id]
+                    entry = (score, block1_id, block2_id)
+                    if len(heap) < self.MAX_CORRELATIONS_PER_BLOCK:
+                        heapq.heappush(heap, entry)
+                    elif score > heap[0][0]:
+                        heapq.heappushpop(heap, entry)
+
             if progress_callback and i % 50 == 0:
                 progress = (i / len(block_ids)) * 100
                 progress_callback(progress, f"Correlated {i}/{len(block_ids)} blocks")
-        
+
+        # Keep only the strongest correlations globally, best first
+        top = heapq.nlargest(
+            self.MAX_CORRELATIONS,
+            (entry for heap in block_heaps.values() for entry in heap))
+        self.correlations = [
+            CorrelationResult(
+                block1_id=block1_id,
+                block2_id=block2_id,
+                correlation_score=score,
+                sequence_order=(block1_id, block2_id),
+                reconstruction_confidence=score
+            )
+            for score, block1_id, block2_id in top
+        ]
+
+        correlations_found = len(self.correlations)
         print(f"[+] Found {correlations_found} correlations")
         return correlations_found
     
     def _calculate_correlation(self, block1, block2):
         """Calculate correlation score between two blocks"""
         score = 0.0
-        
-        # Check tail of block1 with head of block2
-        tail_hash = hashlib.md5(block1.tail_data).hexdigest()
-        head_hash = hashlib.md5(block2.head_data).hexdigest()
-        
-        # Byte-level similarity
-        tail_bytes = block1.tail_data[:128]
-        head_bytes = block2.head_data[:128]
-        
-        matching_bytes = sum(1 for a, b in zip(tail_bytes, head_bytes) if a == b)
-        byte_similarity = matching_bytes / min(len(tail_bytes), len(head_bytes))
+
+        # Byte-level similarity (SIMD compare instead of a Python zip loop)
+        tail_bytes = np.frombuffer(block1.tail_data[:128], dtype=np.uint8)
+        head_bytes = np.frombuffer(block2.head_data[:128], dtype=np.uint8)
+
+        n = min(tail_bytes.size, head_bytes.size)
+        matching_bytes = int(np.count_nonzero(tail_bytes[:n] == head_bytes[:n]))
+        byte_similarity = matching_bytes / n
         
         # Pattern matching
         pattern_match = 0
@@ -355,19 +774,25 @@ class DiskAnalyzer:
     
     def build_timeline(self):
         """Build timeline from block metadata"""
-        timeline_events = []
-        
-        for block_id, block in self.blocks.items():
-            # Use metadata to infer timing
-            if block.metadata.get('has_magic'):
-                timeline_events.append({
-                    'block_id': block_id,
-                    'timestamp': datetime.now(),  # Would use actual metadata
-                    'event_type': 'file_creation',
-                    'details': f"File type: {block.metadata['has_magic']}"
-                })
-        
-        self.timeline = sorted(timeline_events, key=lambda x: x['timestamp'])
+        events = [block for block in self.blocks.values()
+                  if block.metadata.get('has_magic')]
+
+        if not events:
+            self.timeline = []
+            return self.timeline
+
+        # Sort on the real on-disk mtimes via datetime64 argsort; blocks
+        # without a recovered timestamp (NaT) sort to the end
+        times = np.array([block.mtime or np.datetime64('NaT') for block in events],
+                         dtype='datetime64[ns]')
+        order = np.argsort(times)
+
+        self.timeline = [{
+            'block_id': events[i].block_id,
+            'timestamp': events[i].mtime,
+            'event_type': 'file_creation',
+            'details': f"File type: {events[i].metadata['has_magic']}"
+        } for i in order]
         return self.timeline
     
     def get_block_info(self, block_id):
@@ -397,16 +822,27 @@ class ForensicGUI:
     """Main GUI application"""
     
     def __init__(self, root):
+        _lazy_tk()
         self.root = root
         self.root.title("Forensic Disk Analyzer - Professional Edition")
         self.root.geometry("1600x900")
         
         # State
         self.analyzer = None
-        self.treemap_blocks = []
+        self._treemap_layout = None
+        self._treemap_image = None
+        self._treemap_item = None
+        self._rect_ids = []
+        self._block_info_cache = {}
+        self._anomaly_cache = {}
+        self._hover_after_id = None
+        self._last_hover_block_id = None
+        self._resize_after_id = None
+        self._last_canvas_size = None
         self.selected_block = None
         self.analysis_thread = None
         self.progress_queue = queue.Queue()
+        self._tree_populate_gen = {}  # Per-tree generation for chunked loads
         
         # Colors
         self.colors = {
@@ -518,8 +954,10 @@ class ForensicGUI:
         self.canvas.bind('<Button-1>', self.on_canvas_click)
         self.canvas.bind('<Configure>', self.on_canvas_resize)
         
-        # Hover tooltip
-        self.hover_tooltip = None
+        # Hover tooltip (recycled canvas items, created on first use)
+        self.hover_tooltip = False
+        self._tooltip_text = None
+        self._tooltip_bg = None
     
     def _create_details_panel(self, parent):
         """Create details panel for selected block"""
@@ -631,6 +1069,8 @@ class ForensicGUI:
         if filepath:
             try:
                 self.analyzer = DiskAnalyzer()
+                self._block_info_cache.clear()
+                self._anomaly_cache.clear()
                 self.analyzer.load_source(filepath, 'e01')
                 self.update_status(f"Loaded E01: {filepath}")
                 messagebox.showinfo("Success", f"E01 file loaded successfully!\nSize: {self.analyzer.reader.size:,} bytes")
@@ -649,6 +1089,8 @@ class ForensicGUI:
         if device_path:
             try:
                 self.analyzer = DiskAnalyzer()
+                self._block_info_cache.clear()
+                self._anomaly_cache.clear()
                 self.analyzer.load_source(device_path, 'device')
                 self.update_status(f"Loaded device: {device_path}")
                 messagebox.showinfo("Success", f"Device loaded successfully!\nSize: {self.analyzer.reader.size:,} bytes")
@@ -700,6 +1142,8 @@ class ForensicGUI:
                     _, blocks_analyzed = msg
                     self.progress_var.set(100)
                     self.update_status(f"Analysis complete: {blocks_analyzed} blocks analyzed")
+                    self._block_info_cache.clear()
+                    self._anomaly_cache.clear()
                     self.draw_treemap()
                     messagebox.showinfo("Complete", f"Analyzed {blocks_analyzed} blocks successfully!")
                 
@@ -714,65 +1158,126 @@ class ForensicGUI:
         # Schedule next check
         self.root.after(100, self._start_progress_monitor)
     
-    def draw_treemap(self):
-        """Draw treemap visualization of blocks"""
+    def draw_treemap(self, fast_preview=False):
+        """Draw treemap visualization of blocks
+
+        With fast_preview the map is rendered at reduced detail (half
+        resolution, no outlines; tiny blocks skipped on the fallback
+        path) for snappy feedback during interactive operations.
+        """
         if not self.analyzer or not self.analyzer.blocks:
             return
-        
-        self.canvas.delete('all')
-        self.treemap_blocks = []
-        
+
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
-        
+
         if canvas_width < 100:  # Not yet rendered
             canvas_width = 1200
             canvas_height = 600
-        
+
         # Calculate treemap layout
         blocks = list(self.analyzer.blocks.values())
-        total_size = sum(b.size for b in blocks)
-        
+        n_blocks = len(blocks)
+
         # Simple squarified treemap algorithm
         x, y = 10, 10
         width = canvas_width - 20
         height = canvas_height - 20
-        
-        rows = int(math.sqrt(len(blocks)))
-        cols = (len(blocks) + rows - 1) // rows
-        
+
+        rows = max(1, int(math.sqrt(n_blocks)))
+        cols = (n_blocks + rows - 1) // rows
+
         block_width = width / cols
         block_height = height / rows
-        
-        for i, block in enumerate(blocks):
-            row = i // cols
-            col = i % cols
-            
-            bx = x + col * block_width
-            by = y + row * block_height
-            
-            # Determine color based on metadata
-            color = self._get_block_color(block)
-            
-            # Create rectangle
-            rect_id = self.canvas.create_rectangle(
-                bx, by, bx + block_width - 2, by + block_height - 2,
-                fill=color, outline='#1e1e1e', width=1, tags=f"block_{block.block_id}"
-            )
-            
-            # Store block info
-            treemap_block = TreemapBlock(
-                block_id=block.block_id,
-                x=bx, y=by,
-                width=block_width,
-                height=block_height,
-                color=color,
-                metadata=block.metadata
-            )
-            treemap_block.rect_id = rect_id
-            self.treemap_blocks.append(treemap_block)
-        
-        self.update_status(f"Drew treemap: {len(blocks)} blocks")
+
+        # Grid coordinates for all blocks in one vectorized pass: a single
+        # divmod and both rectangle corners, so the draw loop only indexes
+        rows_idx, cols_idx = np.divmod(np.arange(n_blocks), cols)
+        bxs = x + cols_idx * block_width
+        bys = y + rows_idx * block_height
+        bxe = bxs + block_width - 2
+        bye = bys + block_height - 2
+
+        # Branchless color assignment straight from the quantized store
+        # columns, lowest-priority rule first (mirrors _get_block_color)
+        store = self.analyzer.blocks
+        ent = store.entropy_q[:n_blocks]
+        magic_mask = np.array([m is not None for m in store.has_magic[:n_blocks]])
+        zero_mask = np.unpackbits(store.is_zero_bits, count=n_blocks,
+                                  bitorder='little').astype(bool)
+
+        colors = np.where(ent > 5 * 32, '#ce9178', '#007acc')
+        colors = np.where(ent > 7 * 32, '#f48771', colors)
+        colors = np.where(magic_mask, '#4ec9b0', colors)
+        colors = np.where(zero_mask, '#404040', colors)
+
+        # Layout parameters for O(1) arithmetic hit-testing on hover/click
+        self._treemap_layout = TreemapLayout(
+            x=x, y=y, cols=cols, rows=rows,
+            block_width=block_width, block_height=block_height,
+            # View straight into the store column - no per-draw Python
+            # list of ids
+            block_ids=store.block_ids[:n_blocks],
+        )
+
+        if PIL_SUPPORT:
+            # Render every rectangle into one image and blit it with a
+            # single create_image call instead of one Tk call per block.
+            # Previews render at half resolution without outlines and
+            # are upscaled, roughly quartering the rasterization work.
+            scale = 2 if fast_preview else 1
+            img = Image.new('RGB',
+                            (canvas_width // scale, canvas_height // scale),
+                            '#2d2d2d')
+            draw = ImageDraw.Draw(img)
+            outline = None if fast_preview else '#1e1e1e'
+
+            for i in range(n_blocks):
+                draw.rectangle([bxs[i] / scale, bys[i] / scale,
+                                bxe[i] / scale, bye[i] / scale],
+                               fill=str(colors[i]), outline=outline)
+
+            if fast_preview:
+                img = img.resize((canvas_width, canvas_height),
+                                 Image.NEAREST)
+
+            # Keep a reference so Tk doesn't garbage-collect the photo
+            self._treemap_image = ImageTk.PhotoImage(img)
+            if self._treemap_item is None:
+                self._treemap_item = self.canvas.create_image(
+                    0, 0, image=self._treemap_image,
+                    anchor=tk.NW, tags='treemap')
+            else:
+                # Swap the photo on the existing item instead of
+                # churning the canvas display list with delete+create
+                self.canvas.itemconfigure(self._treemap_item,
+                                          image=self._treemap_image)
+        else:
+            skip_small = fast_preview and block_width * block_height < 16
+            for i in range(n_blocks):
+                if skip_small:
+                    if i >= len(self._rect_ids):
+                        break
+                    self.canvas.itemconfigure(self._rect_ids[i],
+                                              state='hidden')
+                elif i < len(self._rect_ids):
+                    # Recycle the rectangle from the previous draw
+                    rect_id = self._rect_ids[i]
+                    self.canvas.coords(rect_id,
+                                       bxs[i], bys[i], bxe[i], bye[i])
+                    self.canvas.itemconfigure(rect_id, fill=str(colors[i]),
+                                              state='normal')
+                else:
+                    self._rect_ids.append(self.canvas.create_rectangle(
+                        bxs[i], bys[i], bxe[i], bye[i],
+                        fill=str(colors[i]), outline='#1e1e1e', width=1,
+                        tags=f"block_{blocks[i].block_id}"
+                    ))
+            # Hide leftovers when the block count shrank
+            for rect_id in self._rect_ids[n_blocks:]:
+                self.canvas.itemconfigure(rect_id, state='hidden')
+
+        self.update_status(f"Drew treemap: {n_blocks} blocks")
     
     def _get_block_color(self, block):
         """Determine block color based on metadata"""
@@ -791,88 +1296,135 @@ class ForensicGUI:
             return '#007acc'  # Blue for low entropy (text/data)
     
     def on_canvas_hover(self, event):
-        """Handle mouse hover over blocks"""
-        # Find block under mouse
-        block = self._find_block_at(event.x, event.y)
-        
+        """Handle mouse hover over blocks (debounced)"""
+        # Coalesce the raw <Motion> stream: only the position where the
+        # cursor settles triggers a tooltip rebuild
+        if self._hover_after_id is not None:
+            self.canvas.after_cancel(self._hover_after_id)
+
+        # React quickly when no tooltip is up; switch lazily when one is
+        delay = 80 if self.hover_tooltip else 20
+        self._hover_after_id = self.canvas.after(
+            delay, self._do_hover, event.x, event.y)
+
+    def _do_hover(self, x, y):
+        """Debounced hover body: resolve the block and update the tooltip"""
+        self._hover_after_id = None
+        block = self._find_block_at(x, y)
+
+        # Dwelling over the same block adds no new information; skip
+        # the tooltip rebuild entirely
+        bid = block.block_id if block else None
+        if bid == self._last_hover_block_id and bid is not None:
+            return
+        self._last_hover_block_id = bid
+
         if block:
             # Show tooltip
-            self._show_tooltip(event.x, event.y, block)
+            self._show_tooltip(x, y, block)
         else:
             self._hide_tooltip()
     
+    def _block_info(self, block_id):
+        """get_block_info with a small cache for hover-heavy paths
+
+        Repeat lookups of the same block while the cursor dwells skip
+        the store round-trip. Cleared whenever analysis reruns.
+        """
+        info = self._block_info_cache.get(block_id)
+        if info is None:
+            info = self.analyzer.get_block_info(block_id)
+            if len(self._block_info_cache) >= 512:
+                self._block_info_cache.clear()
+            self._block_info_cache[block_id] = info
+        return info
+
     def _find_block_at(self, x, y):
-        """Find treemap block at coordinates"""
-        for block in self.treemap_blocks:
-            if (block.x <= x <= block.x + block.width and
-                block.y <= y <= block.y + block.height):
-                return block
-        return None
+        """Find treemap block at coordinates (O(1) grid arithmetic)"""
+        layout = self._treemap_layout
+        if not layout:
+            return None
+
+        col = int((x - layout.x) // layout.block_width)
+        row = int((y - layout.y) // layout.block_height)
+
+        if x < layout.x or y < layout.y or col >= layout.cols:
+            return None
+
+        idx = row * layout.cols + col
+        if not 0 <= idx < len(layout.block_ids):
+            return None
+
+        block = TreemapBlock(
+            block_id=int(layout.block_ids[idx]),
+            x=layout.x + col * layout.block_width,
+            y=layout.y + row * layout.block_height,
+            width=layout.block_width,
+            height=layout.block_height,
+            color=None,
+            metadata=None
+        )
+        return block
     
     def _show_tooltip(self, x, y, treemap_block):
         """Show tooltip with block information"""
-        self._hide_tooltip()
-        
-        block_data = self.analyzer.get_block_info(treemap_block.block_id)
+        block_data = self._block_info(treemap_block.block_id)
         if not block_data:
             return
         
         # Create tooltip with REAL timestamps from disk metadata
-        tooltip_text = f"Block ID: {block_data.block_id}\n"
-        tooltip_text += f"Offset: 0x{block_data.offset:08x}\n"
-        tooltip_text += f"Size: {block_data.size} bytes\n"
-        
-        if block_data.metadata.get('has_magic'):
-            tooltip_text += f"Type: {block_data.metadata['has_magic']}\n"
-        
-        tooltip_text += f"Entropy: {block_data.metadata['entropy']:.2f}\n"
-        
-        tooltip_text += "\nMACB Timestamps (from disk metadata):\n"
-        
+        metadata = block_data.metadata
+        parts = [
+            f"Block ID: {block_data.block_id}\n",
+            f"Offset: 0x{block_data.offset:08x}\n",
+            f"Size: {block_data.size} bytes\n",
+        ]
+
+        if metadata.get('has_magic'):
+            parts.append(f"Type: {metadata['has_magic']}\n")
+
+        parts.append(f"Entropy: {metadata['entropy']:.2f}\n")
+
+        parts.append("\nMACB Timestamps (from disk metadata):\n")
+
         # Show REAL timestamps from filesystem structures
-        if block_data.mtime:
-            tooltip_text += f"M (Modified): {block_data.mtime.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        else:
-            tooltip_text += f"M (Modified): Not available\n"
-        
-        if block_data.ctime:
-            tooltip_text += f"C (Changed):  {block_data.ctime.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        else:
-            tooltip_text += f"C (Changed):  Not available\n"
-        
-        if block_data.atime:
-            tooltip_text += f"A (Accessed): {block_data.atime.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        else:
-            tooltip_text += f"A (Accessed): Not available\n"
-        
-        if block_data.btime:
-            tooltip_text += f"B (Birth):    {block_data.btime.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        else:
-            tooltip_text += f"B (Birth):    Not available\n"
-        
-        self.hover_tooltip = self.canvas.create_text(
-            x + 10, y + 10,
-            text=tooltip_text,
-            anchor=tk.NW,
-            fill='white',
-            font=('Consolas', 9),
-            tags='tooltip'
-        )
-        
-        # Background for tooltip
-        bbox = self.canvas.bbox(self.hover_tooltip)
-        self.canvas.create_rectangle(
-            bbox[0] - 5, bbox[1] - 5,
-            bbox[2] + 5, bbox[3] + 5,
-            fill='#2d2d2d', outline='white',
-            tags='tooltip_bg'
-        )
-        self.canvas.tag_lower('tooltip_bg', self.hover_tooltip)
-    
+        for label, ts in (('M (Modified): ', block_data.mtime),
+                          ('C (Changed):  ', block_data.ctime),
+                          ('A (Accessed): ', block_data.atime),
+                          ('B (Birth):    ', block_data.btime)):
+            if ts:
+                parts.append(f"{label}{_fmt_ts(ts, '%Y-%m-%d %H:%M:%S')}\n")
+            else:
+                parts.append(f"{label}Not available\n")
+
+        tooltip_text = ''.join(parts)
+
+        # Reuse one persistent text + background item pair; mutating their
+        # coords/text avoids churning Tk's display list on every hover
+        if self._tooltip_text is None:
+            self._tooltip_bg = self.canvas.create_rectangle(
+                0, 0, 0, 0, fill='#2d2d2d', outline='white', state='hidden')
+            self._tooltip_text = self.canvas.create_text(
+                0, 0, anchor=tk.NW, fill='white',
+                font=('Consolas', 9), state='hidden')
+
+        self.canvas.coords(self._tooltip_text, x + 10, y + 10)
+        self.canvas.itemconfigure(self._tooltip_text,
+                                  text=tooltip_text, state='normal')
+
+        # Background sized to the text
+        bbox = self.canvas.bbox(self._tooltip_text)
+        self.canvas.coords(self._tooltip_bg,
+                           bbox[0] - 5, bbox[1] - 5, bbox[2] + 5, bbox[3] + 5)
+        self.canvas.itemconfigure(self._tooltip_bg, state='normal')
+        self.hover_tooltip = True
+
     def _hide_tooltip(self):
         """Hide tooltip"""
-        self.canvas.delete('tooltip')
-        self.canvas.delete('tooltip_bg')
+        if self._tooltip_text is not None:
+            self.canvas.itemconfigure(self._tooltip_text, state='hidden')
+            self.canvas.itemconfigure(self._tooltip_bg, state='hidden')
+        self.hover_tooltip = False
     
     def on_canvas_click(self, event):
         """Handle block click"""
@@ -884,95 +1436,121 @@ class ForensicGUI:
     
     def show_block_details(self, block_id):
         """Show detailed information about selected block"""
-        block_data = self.analyzer.get_block_info(block_id)
+        block_data = self._block_info(block_id)
         if not block_data:
             return
         
         # Update metadata tab
         self.metadata_text.delete('1.0', tk.END)
-        metadata_info = f"Block ID: {block_data.block_id}\n"
-        metadata_info += f"Offset: 0x{block_data.offset:08x}\n"
-        metadata_info += f"Size: {block_data.size} bytes\n"
-        metadata_info += f"Filesystem: {self.analyzer.filesystem_type}\n\n"
-        metadata_info += f"Metadata:\n"
-        for key, value in block_data.metadata.items():
-            metadata_info += f"  {key}: {value}\n"
-        self.metadata_text.insert('1.0', metadata_info)
+        metadata_parts = [
+            f"Block ID: {block_data.block_id}\n",
+            f"Offset: 0x{block_data.offset:08x}\n",
+            f"Size: {block_data.size} bytes\n",
+            f"Filesystem: {self.analyzer.filesystem_type}\n\n",
+            "Metadata:\n",
+        ]
+        metadata_parts += [f"  {key}: {value}\n"
+                           for key, value in block_data.metadata.items()]
+        self.metadata_text.insert('1.0', ''.join(metadata_parts))
         
         # Update hex view
         self.hex_text.delete('1.0', tk.END)
         hex_view = self._format_hex(block_data.head_data)
         self.hex_text.insert('1.0', hex_view)
         
-        # Update timestamps with REAL MACB times from disk
+        # Update timestamps with REAL MACB times from disk; bind the
+        # four timestamps once instead of re-reading attributes per check
+        m, c, a, b = (block_data.mtime, block_data.ctime,
+                      block_data.atime, block_data.btime)
+
         self.timestamp_text.delete('1.0', tk.END)
-        timestamp_info = "=== MACB Timestamps (from disk metadata) ===\n\n"
-        
-        if block_data.mtime:
-            timestamp_info += f"M - Modified Time (mtime):\n"
-            timestamp_info += f"    {block_data.mtime.strftime('%Y-%m-%d %H:%M:%S.%f')}\n"
-            timestamp_info += f"    Unix: {int(block_data.mtime.timestamp())}\n\n"
-        else:
-            timestamp_info += f"M - Modified Time (mtime):\n"
-            timestamp_info += f"    Not available in filesystem metadata\n\n"
-        
-        if block_data.ctime:
-            timestamp_info += f"C - Changed/Created Time (ctime):\n"
-            timestamp_info += f"    {block_data.ctime.strftime('%Y-%m-%d %H:%M:%S.%f')}\n"
-            timestamp_info += f"    Unix: {int(block_data.ctime.timestamp())}\n\n"
-        else:
-            timestamp_info += f"C - Changed/Created Time (ctime):\n"
-            timestamp_info += f"    Not available in filesystem metadata\n\n"
-        
-        if block_data.atime:
-            timestamp_info += f"A - Accessed Time (atime):\n"
-            timestamp_info += f"    {block_data.atime.strftime('%Y-%m-%d %H:%M:%S.%f')}\n"
-            timestamp_info += f"    Unix: {int(block_data.atime.timestamp())}\n\n"
-        else:
-            timestamp_info += f"A - Accessed Time (atime):\n"
-            timestamp_info += f"    Not available in filesystem metadata\n\n"
-        
-        if block_data.btime:
-            timestamp_info += f"B - Birth Time (btime):\n"
-            timestamp_info += f"    {block_data.btime.strftime('%Y-%m-%d %H:%M:%S.%f')}\n"
-            timestamp_info += f"    Unix: {int(block_data.btime.timestamp())}\n\n"
-        else:
-            timestamp_info += f"B - Birth Time (btime):\n"
-            timestamp_info += f"    Not available in filesystem metadata\n\n"
-        
-        # Add forensic analysis
-        timestamp_info += "\n=== Forensic Analysis ===\n\n"
-        
-        if block_data.mtime and block_data.ctime:
-            if block_data.mtime > block_data.ctime:
-                timestamp_info += "⚠️  WARNING: mtime > ctime\n"
-                timestamp_info += "    This is IMPOSSIBLE in normal operations!\n"
-                timestamp_info += "    Indicates possible TIMESTOMPING (anti-forensics)\n\n"
+        ts_parts = ["=== MACB Timestamps (from disk metadata) ===\n\n"]
+
+        for label, ts in (('M - Modified Time (mtime)', m),
+                          ('C - Changed/Created Time (ctime)', c),
+                          ('A - Accessed Time (atime)', a),
+                          ('B - Birth Time (btime)', b)):
+            ts_parts.append(f"{label}:\n")
+            if ts:
+                ts_parts.append(f"    {_fmt_ts(ts, '%Y-%m-%d %H:%M:%S.%f')}\n")
+                ts_parts.append(f"    Unix: {int(ts.timestamp())}\n\n")
             else:
-                timestamp_info += "✓  Timestamps appear normal\n\n"
-        
-        if block_data.mtime and block_data.atime:
-            if block_data.atime < block_data.mtime:
-                timestamp_info += "⚠️  WARNING: atime < mtime\n"
-                timestamp_info += "    File accessed before it was modified\n"
-                timestamp_info += "    Possible timestamp manipulation\n\n"
-        
-        self.timestamp_text.insert('1.0', timestamp_info)
+                ts_parts.append("    Not available in filesystem metadata\n\n")
+
+        # Anomaly report is cached per block: repeat clicks on the same
+        # selection skip the datetime conversions and comparisons
+        report = self._anomaly_cache.get(block_id)
+        if report is None:
+            mu = m.timestamp() if m else None
+            cu = c.timestamp() if c else None
+            au = a.timestamp() if a else None
+
+            parts = ["\n=== Forensic Analysis ===\n\n"]
+            if mu is not None and cu is not None:
+                if mu > cu:
+                    parts.append("⚠️  WARNING: mtime > ctime\n")
+                    parts.append("    This is IMPOSSIBLE in normal operations!\n")
+                    parts.append("    Indicates possible TIMESTOMPING (anti-forensics)\n\n")
+                else:
+                    parts.append("✓  Timestamps appear normal\n\n")
+
+            if mu is not None and au is not None and au < mu:
+                parts.append("⚠️  WARNING: atime < mtime\n")
+                parts.append("    File accessed before it was modified\n")
+                parts.append("    Possible timestamp manipulation\n\n")
+
+            report = ''.join(parts)
+            self._anomaly_cache[block_id] = report
+        ts_parts.append(report)
+
+        self.timestamp_text.insert('1.0', ''.join(ts_parts))
         
         self.update_status(f"Selected block {block_id} - Filesystem: {self.analyzer.filesystem_type}")
     
     def _format_hex(self, data):
-        """Format data as hex dump"""
+        """Format data as hex dump
+
+        Every per-byte operation runs at C level: bytes.hex for the hex
+        column, bytes.translate for the ASCII column, and the offset
+        labels come from a precomputed table.
+        """
+        data = bytes(data[:512])
+        ascii_tbl = _ASCII_TBL
         hex_lines = []
-        for i in range(0, min(len(data), 512), 16):
+        for line_no, i in enumerate(range(0, len(data), 16)):
             chunk = data[i:i+16]
-            hex_part = ' '.join(f'{b:02x}' for b in chunk)
-            ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-            hex_lines.append(f"{i:08x}  {hex_part:<48}  {ascii_part}")
+            hex_part = chunk.hex(' ')
+            ascii_part = chunk.translate(ascii_tbl).decode('latin1')
+            hex_lines.append(f"{_OFFSET_LBLS[line_no]}  {hex_part:<48}  {ascii_part}")
         return '\n'.join(hex_lines)
     
     def on_canvas_resize(self, event):
-        """Handle canvas resize"""
+        """Handle canvas resize, coalescing the event storm Tk emits
+        during a drag into a single redraw once the size settles"""
+        size = (event.width, event.height)
+        if size == self._last_canvas_size:
+            # Tk fires spurious Configure events with unchanged geometry
+            return
+        self._last_canvas_size = size
+
+        if self._resize_after_id is not None:
+            self.canvas.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.canvas.after(80, self._do_resize_redraw)
+
+    def _do_resize_redraw(self):
+        """Redraw the treemap after resize events have gone quiet"""
+        self._resize_after_id = None
+        if self.analyzer and self.analyzer.blocks:
+            # Cheap preview first, then upgrade to full detail once the
+            # gesture has clearly settled; a further resize cancels the
+            # pending upgrade through the same after id
+            self.draw_treemap(fast_preview=True)
+            self._resize_after_id = self.canvas.after(
+                200, self._do_full_redraw)
+
+    def _do_full_redraw(self):
+        """Upgrade the preview treemap to a full-detail render"""
+        self._resize_after_id = None
         if self.analyzer and self.analyzer.blocks:
             self.draw_treemap()
     
@@ -998,28 +1576,64 @@ class ForensicGUI:
         thread.daemon = True
         thread.start()
     
+    def _populate_tree_chunked(self, tree, rows, idx=0, chunk=500, gen=None):
+        """Insert Treeview rows in chunks so bulk loads don't freeze the UI
+
+        Column display is suspended during the load to skip per-row width
+        recomputation, and each chunk yields back to the Tk event loop.
+        Each load carries a per-tree generation so a new populate
+        supersedes one still streaming: stale continuations see a newer
+        generation and stop instead of re-inserting into the cleared tree.
+        """
+        if idx == 0:
+            gen = self._tree_populate_gen.get(tree, 0) + 1
+            self._tree_populate_gen[tree] = gen
+            tree.delete(*tree.get_children())
+            tree.configure(displaycolumns=())
+        elif gen != self._tree_populate_gen.get(tree):
+            return
+
+        end = min(idx + chunk, len(rows))
+        # Pre-bound insert avoids a method lookup per row
+        insert = tree.insert
+        for values in rows[idx:end]:
+            insert('', 'end', values=values)
+
+        if end < len(rows):
+            self.root.after(1, self._populate_tree_chunked, tree, rows, end,
+                            chunk, gen)
+        else:
+            tree.configure(displaycolumns='#all')
+
     def build_timeline(self):
         """Build and display timeline"""
         if not self.analyzer:
             messagebox.showwarning("Warning", "Please load evidence first.")
             return
-        
-        timeline = self.analyzer.build_timeline()
-        
-        # Clear timeline tree
-        for item in self.timeline_tree.get_children():
-            self.timeline_tree.delete(item)
-        
-        # Populate timeline
-        for event in timeline:
-            self.timeline_tree.insert('', 'end', values=(
-                event['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
+
+        self.update_status("Building timeline...")
+
+        def timeline_thread():
+            # Build and pre-format every row off the main thread; only
+            # the batched Treeview inserts touch Tk
+            timeline = self.analyzer.build_timeline()
+            rows = [(
+                _fmt_ts(event['timestamp'], '%Y-%m-%d %H:%M:%S')
+                if event['timestamp'] else 'Unknown',
                 event['block_id'],
                 event['event_type'],
                 event['details']
-            ))
-        
-        self.update_status(f"Built timeline: {len(timeline)} events")
+            ) for event in timeline]
+            self.root.after(0, self._show_timeline_rows, rows)
+
+        thread = threading.Thread(target=timeline_thread)
+        thread.daemon = True
+        thread.start()
+
+    def _show_timeline_rows(self, rows):
+        """Apply pre-formatted timeline rows on the main thread"""
+        self._populate_tree_chunked(self.timeline_tree, rows)
+        self.update_status(f"Built timeline: {len(rows)} events")
     
     def export_report(self):
         """Export forensic report"""
@@ -1045,12 +1659,17 @@ class ForensicGUI:
                         'size': b.size,
                         'metadata': b.metadata
                     }
-                    for b in list(self.analyzer.blocks.values())[:100]  # Sample
+                    # islice avoids materializing every block just to
+                    # sample the first 100
+                    for b in itertools.islice(self.analyzer.blocks.values(), 100)
                 ]
             }
-            
+
             with open(filepath, 'w') as f:
-                json.dump(report, f, indent=2)
+                # Stream the JSON out chunk by chunk instead of building
+                # the whole document in memory first
+                for chunk in json.JSONEncoder(indent=2).iterencode(report):
+                    f.write(chunk)
             
             messagebox.showinfo("Success", f"Report exported to {filepath}")
             self.update_status(f"Exported report to {filepath}")
@@ -1061,17 +1680,15 @@ class ForensicGUI:
             messagebox.showwarning("Warning", "Please run correlation first.")
             return
         
-        # Show correlation results
-        self.correlation_tree.delete(*self.correlation_tree.get_children())
-        
-        for corr in self.analyzer.correlations[:50]:  # Show first 50
-            self.correlation_tree.insert('', 'end', values=(
-                corr.block1_id,
-                corr.block2_id,
-                f"{corr.correlation_score:.3f}",
-                f"{corr.sequence_order[0]} → {corr.sequence_order[1]}",
-                f"{corr.reconstruction_confidence:.2%}"
-            ))
+        # Show correlation results in batches
+        rows = [(
+            corr.block1_id,
+            corr.block2_id,
+            f"{corr.correlation_score:.3f}",
+            f"{corr.sequence_order[0]} → {corr.sequence_order[1]}",
+            f"{corr.reconstruction_confidence:.2%}"
+        ) for corr in self.analyzer.correlations[:50]]  # Show top 50
+        self._populate_tree_chunked(self.correlation_tree, rows)
         
         messagebox.showinfo("Correlation Results", 
                            f"Found {len(self.analyzer.correlations)} correlations.\n"
@@ -1084,6 +1701,7 @@ class ForensicGUI:
 
 def main():
     """Main entry point"""
+    _lazy_tk()
     root = tk.Tk()
     app = ForensicGUI(root)
     root.mainloop()
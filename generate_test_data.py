@@ -12,37 +12,78 @@ from pathlib import Path
 class ForensicTestDataGenerator:
     """Generate test disk images with forensic scenarios"""
     
+    # Shared zero buffer for block padding - avoids allocating fresh
+    # bytes objects for every pad
+    _ZERO_BLOCK = b'\x00' * 4096
+
     def __init__(self, output_path, size_mb=10):
         self.output_path = Path(output_path)
         self.size_bytes = size_mb * 1024 * 1024
         self.block_size = 4096
-        
+
+    def _pad_to_block(self, f):
+        """Pad file position to the next block boundary"""
+        padding = (self.block_size - (f.tell() % self.block_size)) % self.block_size
+        if padding > 0:
+            f.write(self._ZERO_BLOCK[:padding])
+
+    def _take(self, n):
+        """Slice n random bytes from the pre-allocated pool
+
+        One big os.urandom call up front replaces a syscall per write;
+        falls back to a direct call if the pool estimate runs short.
+        """
+        end = self._rand_off + n
+        if end > len(self._rand_pool):
+            return os.urandom(n)
+        data = self._rand_pool[self._rand_off:end]
+        self._rand_off = end
+        return data
+
     def generate(self):
         """Generate complete test disk image"""
         print(f"[*] Creating test disk image: {self.output_path}")
         print(f"[*] Size: {self.size_bytes / (1024*1024):.1f} MB")
-        
-        with open(self.output_path, 'wb') as f:
-            # Scenario 1: Normal files (JPEG images)
-            self._write_jpeg_files(f, count=5)
-            
-            # Scenario 2: Fragmented file
-            self._write_fragmented_file(f)
-            
-            # Scenario 3: Deleted file (zeros with remnants)
-            self._write_deleted_file_remnants(f)
-            
-            # Scenario 4: Encrypted/compressed data
-            self._write_encrypted_data(f)
-            
-            # Scenario 5: Text files
-            self._write_text_files(f, count=3)
-            
-            # Fill remaining with zeros
-            current_pos = f.tell()
-            remaining = self.size_bytes - current_pos
-            if remaining > 0:
-                f.write(b'\x00' * remaining)
+
+        # Random-byte pool covering every scenario's worst case
+        # (5 JPEGs up to 32 KB each, PNG fragments, PDF remnants,
+        # encrypted container) with a little headroom
+        self._rand_pool = os.urandom(256 * 1024)
+        self._rand_off = 0
+
+        # Precomputed layout: each scenario gets a fixed, block-aligned
+        # region sized for its worst case, so offsets are stable run to
+        # run and writers are independent of each other's lengths
+        bs = self.block_size
+        scenarios = [
+            ('JPEG files', 5 * 32768, self._write_jpeg_files),
+            ('Fragmented PNG', 23 * bs, self._write_fragmented_file),
+            ('Deleted PDF remnants', 3 * bs, self._write_deleted_file_remnants),
+            ('Encrypted container', 5 * bs, self._write_encrypted_data),
+            ('Text files', 6 * bs, self._write_text_files),
+        ]
+        self.layout = []
+        offset = 0
+        for name, size, _ in scenarios:
+            self.layout.append((name, offset, size))
+            offset += size
+
+        # 1 MiB buffer keeps the many small block-sized writes from
+        # flushing to a syscall at every boundary
+        with open(self.output_path, 'wb', buffering=1024*1024) as f:
+            # Allocate the full (sparse) image up front; each scenario
+            # then seeks to its precomputed offset, which also enforces
+            # alignment between regions
+            f.truncate(self.size_bytes)
+
+            for (name, offset, size), (_, _, writer) in zip(self.layout,
+                                                            scenarios):
+                f.seek(offset)
+                writer(f)
+
+        print("[*] Scenario layout:")
+        for name, offset, size in self.layout:
+            print(f"    0x{offset:08x}  {size:>7} bytes  {name}")
         
         print(f"[+] Test disk image created successfully!")
         print(f"[+] Location: {self.output_path.absolute()}")
@@ -60,7 +101,7 @@ class ForensicTestDataGenerator:
             
             # Random image data
             size = random.randint(8192, 32768)
-            image_data = os.urandom(size - len(jpeg_header) - 2)
+            image_data = self._take(size - len(jpeg_header) - 2)
             
             # JPEG footer
             jpeg_footer = b'\xFF\xD9'
@@ -69,12 +110,9 @@ class ForensicTestDataGenerator:
             f.write(jpeg_header)
             f.write(image_data)
             f.write(jpeg_footer)
-            
+
             # Pad to block boundary
-            current_pos = f.tell()
-            padding = (self.block_size - (current_pos % self.block_size)) % self.block_size
-            if padding > 0:
-                f.write(b'\x00' * padding)
+            self._pad_to_block(f)
     
     def _write_fragmented_file(self, f):
         """Write a fragmented file (parts separated)"""
@@ -82,7 +120,7 @@ class ForensicTestDataGenerator:
         
         # Part 1: PNG header and beginning
         png_header = b'\x89PNG\r\n\x1a\n'
-        part1_data = os.urandom(self.block_size - len(png_header))
+        part1_data = self._take(self.block_size - len(png_header))
         
         f.write(png_header)
         f.write(part1_data)
@@ -92,7 +130,7 @@ class ForensicTestDataGenerator:
         f.write(b'\x00' * (gap_blocks * self.block_size))
         
         # Part 2: Middle of PNG
-        part2_data = os.urandom(self.block_size)
+        part2_data = self._take(self.block_size)
         f.write(part2_data)
         
         # Another gap
@@ -100,15 +138,12 @@ class ForensicTestDataGenerator:
         
         # Part 3: End of PNG
         png_footer = b'IEND\xaeB`\x82'
-        part3_data = os.urandom(self.block_size - len(png_footer))
+        part3_data = self._take(self.block_size - len(png_footer))
         f.write(part3_data)
         f.write(png_footer)
         
         # Pad to block boundary
-        current_pos = f.tell()
-        padding = (self.block_size - (current_pos % self.block_size)) % self.block_size
-        if padding > 0:
-            f.write(b'\x00' * padding)
+        self._pad_to_block(f)
     
     def _write_deleted_file_remnants(self, f):
         """Write remnants of deleted file"""
@@ -116,7 +151,7 @@ class ForensicTestDataGenerator:
         
         # First part: File header (partially overwritten)
         pdf_header = b'%PDF-1.4\n'
-        partial_data = os.urandom(2048)
+        partial_data = self._take(2048)
         
         # Write header and partial data
         f.write(pdf_header)
@@ -127,14 +162,11 @@ class ForensicTestDataGenerator:
         
         # Remnant: tail of file still present
         remnant_data = b'%%EOF\n'
-        f.write(os.urandom(4096 - len(remnant_data)))
+        f.write(self._take(4096 - len(remnant_data)))
         f.write(remnant_data)
         
         # Pad to block boundary
-        current_pos = f.tell()
-        padding = (self.block_size - (current_pos % self.block_size)) % self.block_size
-        if padding > 0:
-            f.write(b'\x00' * padding)
+        self._pad_to_block(f)
     
     def _write_encrypted_data(self, f):
         """Write encrypted/random data (high entropy)"""
@@ -146,16 +178,13 @@ class ForensicTestDataGenerator:
         
         # High-entropy data (simulated encryption)
         encrypted_size = 16384
-        encrypted_data = os.urandom(encrypted_size)
+        encrypted_data = self._take(encrypted_size)
         
         f.write(header)
         f.write(encrypted_data)
         
         # Pad to block boundary
-        current_pos = f.tell()
-        padding = (self.block_size - (current_pos % self.block_size)) % self.block_size
-        if padding > 0:
-            f.write(b'\x00' * padding)
+        self._pad_to_block(f)
     
     def _write_text_files(self, f, count=3):
         """Write sample text files"""
@@ -174,10 +203,7 @@ class ForensicTestDataGenerator:
             f.write(text_data)
             
             # Pad to block boundary
-            current_pos = f.tell()
-            padding = (self.block_size - (current_pos % self.block_size)) % self.block_size
-            if padding > 0:
-                f.write(b'\x00' * padding)
+            self._pad_to_block(f)
 
 
 def main():